@@ -32,10 +32,10 @@ function Invoke-Capture {
     if ($Cmd.Length -gt 1) {
         $args = $Cmd[1..($Cmd.Length - 1)]
     }
-    $out = & $exe @args 2>&1 | Out-String
-    $code = $LASTEXITCODE
     $path = Join-Path $OutputDir $OutputFile
-    Set-Content -Path $path -Value $out -Encoding UTF8
+    # Stream output to the file as it is produced; sfc/DISM logs can be large.
+    & $exe @args 2>&1 | Out-File -FilePath $path -Encoding UTF8
+    $code = $LASTEXITCODE
     return [pscustomobject]@{
         name = $Name
         cmd = $Cmd
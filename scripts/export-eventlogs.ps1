@@ -14,5 +14,20 @@ if (-not (Test-Path $OutputDir)) {
 $ms = [int]($Hours * 3600 * 1000)
 $query = "*[System[TimeCreated[timediff(@SystemTime) <= $ms]]]"
 
-wevtutil epl System (Join-Path $OutputDir "System.evtx") /q:$query | Out-Null
-wevtutil epl Application (Join-Path $OutputDir "Application.evtx") /q:$query | Out-Null
+# Each export walks its own EVTX file, so run them side by side and wait for both.
+$procs = foreach ($log in @("System", "Application")) {
+    $path = Join-Path $OutputDir "$log.evtx"
+    $proc = Start-Process -FilePath "wevtutil.exe" `
+        -ArgumentList @("epl", $log, "`"$path`"", "`"/q:$query`"") `
+        -NoNewWindow -PassThru
+    # Touch Handle so ExitCode is still available after the process exits.
+    $null = $proc.Handle
+    [pscustomobject]@{ Log = $log; Process = $proc }
+}
+
+foreach ($item in $procs) {
+    $item.Process.WaitForExit()
+    if ($item.Process.ExitCode -ne 0) {
+        [Console]::Error.WriteLine("wevtutil epl $($item.Log) failed with exit code $($item.Process.ExitCode)")
+    }
+}
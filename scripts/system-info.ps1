@@ -16,11 +16,19 @@ function Convert-DateValue {
     }
 }
 
-$os = Get-CimInstance Win32_OperatingSystem -ErrorAction SilentlyContinue
-$bios = Get-CimInstance Win32_BIOS -ErrorAction SilentlyContinue
-$cpu = Get-CimInstance Win32_Processor -ErrorAction SilentlyContinue
-$cs = Get-CimInstance Win32_ComputerSystem -ErrorAction SilentlyContinue
-$gpus = Get-CimInstance Win32_VideoController -ErrorAction SilentlyContinue
+# One local CIM session serves every query instead of a new WMI connection
+# per class. Falls back to the implicit per-call connection if it can't open.
+$cimArgs = @{ ErrorAction = "SilentlyContinue" }
+$session = New-CimSession -ErrorAction SilentlyContinue
+if ($session) { $cimArgs.CimSession = $session }
+
+$os = Get-CimInstance Win32_OperatingSystem @cimArgs
+$bios = Get-CimInstance Win32_BIOS @cimArgs
+$cpu = Get-CimInstance Win32_Processor @cimArgs
+$cs = Get-CimInstance Win32_ComputerSystem @cimArgs
+$gpus = Get-CimInstance Win32_VideoController @cimArgs
+
+if ($session) { Remove-CimSession -CimSession $session }
 
 $cpuInfo = @()
 if ($cpu) {
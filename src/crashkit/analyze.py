@@ -2,19 +2,70 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import json
 import os
 import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Iterable, List, Optional, Tuple
 
-TIME_KEYS = ("TimeCreated", "TimeGenerated")
-_FMT_SAMPLE = datetime(2000, 1, 1, 1, 1, 1, 123456)
-_FMT_LEN_CACHE: dict[str, int] = {}
+try:
+    import orjson  # optional: much faster decode of large event exports
+except ImportError:
+    orjson = None
 
-@dataclass
+TIME_KEYS = ("TimeCreated", "TimeGenerated")
+# (log name, file under logs/) for each event export
+LOG_FILES = (
+    ("System", "system_events.json"),
+    ("Application", "application_events.json"),
+    ("SystemProviderFocus", "system_provider_focus.json"),
+    ("Reliability", "reliability_records.json"),
+    ("WEROperational", "wer_systemerrorreporting.json"),
+)
+# Focused high-signal IDs for extract_key_lines
+_HIGH_IDS: frozenset[int] = frozenset({41, 6008, 1001, 4101, 14, 13, 161, 219, 1000, 1002, 1026})
+
+_WS_RE = re.compile(r"\s+")
+_TZ_RE = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+# Lenient fallbacks for export shapes fromisoformat rejects. Not anchored at
+# the end so trailing offsets and other suffixes are ignored.
+_DT_ISO_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})[ T](\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,6}))?")
+_DT_US_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})\s*([AP]M)", re.IGNORECASE)
+# Everything below is matched against case-folded text. Suspect literals are
+# lowered when _SUSPECT_LITERALS is built; the provider literals and the
+# regex patterns are already written lower-case.
+_HIGH_PROVIDER_LITERALS = ("kernel-power", "whea", "nvlddmkm", "display", "bugcheck", "windows error reporting", "application error")
+
+# (slug, display name, literal substrings, regex or None) for each suspect bucket.
+# Plain substrings are checked with `in` on the case-folded blob; only true
+# patterns go through the regex engine.
+_SUSPECT_BUCKETS = (
+    ("gpu", "GPU driver reset (TDR) or display stack", ("Display driver", "nvlddmkm", "amdkmdag", "DXGI", "TDR", "LiveKernelEvent", "VIDEO_TDR", "GPU"), None),
+    ("power", "Kernel power / unexpected reboot", ("Kernel-Power", "Event ID 41", "The system has rebooted without cleanly shutting down"), None),
+    ("bsod", "Bugcheck / BSOD style crash", ("bugcheck", "MEMORY.DMP", "minidump", "BlueScreen", "STOP_CODE"), r"0x[0-9a-f]+"),
+    ("whea", "WHEA hardware error (CPU, RAM, PCIe, GPU)", ("WHEA", "Machine Check Exception", "Corrected hardware error"), None),
+    ("app", "Game or app crash/hang", ("Faulting application", "AppHang", "Exception code", "stopped working", "ARC Raiders", "UE4", "Unreal"), None),
+    ("driver", "Driver/service instability", ("driver", "service terminated", "failed to start", "DeviceSetupManager", "Kernel-PnP"), None),
+    ("disk", "Disk/FS instability", ("disk", "ntfs", "volmgr", "storahci", "Reset to device", "bad block", "corruption"), None),
+)
+_SUSPECT_NAMES = {slug: name for slug, name, _, _ in _SUSPECT_BUCKETS}
+_SUSPECT_LITERALS = tuple(
+    (slug, tuple(lit.lower() for lit in literals)) for slug, _, literals, _ in _SUSPECT_BUCKETS
+)
+# Only true patterns go through the regex engine, one search per bucket.
+_SUSPECT_PATTERNS = tuple(
+    (slug, re.compile(pat)) for slug, _, _, pat in _SUSPECT_BUCKETS if pat
+)
+
+@dataclass(slots=True)
 class Event:
     time: Optional[datetime]
     log: str
@@ -22,6 +73,7 @@ class Event:
     level: str
     provider: str
     message: str
+    raw_time: Optional[str] = None
 
 def _parse_dt(s: Any) -> Optional[datetime]:
     if not s:
@@ -32,58 +84,53 @@ def _parse_dt(s: Any) -> Optional[datetime]:
         text = s.strip()
         if not text:
             return None
+        return _parse_dt_str(text)
+    return None
 
-        def _fmt_len(fmt: str) -> int:
-            cached = _FMT_LEN_CACHE.get(fmt)
-            if cached is None:
-                cached = len(_FMT_SAMPLE.strftime(fmt))
-                _FMT_LEN_CACHE[fmt] = cached
-            return cached
-
-        def _strip_tz(value: str) -> str:
-            return re.sub(r"(Z|[+-]\d{2}:?\d{2})$", "", value)
-
-        candidates = [text]
-        stripped = _strip_tz(text)
-        if stripped != text:
-            candidates.append(stripped)
-
-        formats = (
-            "%Y-%m-%dT%H:%M:%S.%f",
-            "%Y-%m-%dT%H:%M:%S",
-            "%m/%d/%Y %I:%M:%S %p",
-            "%Y-%m-%d %H:%M:%S",
-        )
-
-        # Handle typical Windows formats seen in exports
-        for cand in candidates:
-            for fmt in formats:
-                try:
-                    return datetime.strptime(cand, fmt)
-                except Exception:
-                    try:
-                        expect_len = _fmt_len(fmt)
-                        if len(cand) >= expect_len:
-                            return datetime.strptime(cand[:expect_len], fmt)
-                    except Exception:
-                        pass
-
-        # Try ISO-ish
-        try:
-            return datetime.fromisoformat(text.replace("Z", ""))
-        except Exception:
-            return None
+# Exports often repeat the same timestamp (same-second bursts), so memoize the
+# string parse. load_events clears this once a bundle is loaded.
+@lru_cache(maxsize=4096)
+def _parse_dt_str(text: str) -> Optional[datetime]:
+    # fromisoformat is C-implemented and covers the common ISO shapes. Any
+    # offset is dropped so all parsed times stay naive and comparable.
+    try:
+        return datetime.fromisoformat(_TZ_RE.sub("", text)).replace(tzinfo=None)
+    except ValueError:
+        pass
+
+    # Handle the other Windows formats seen in exports
+    try:
+        m = _DT_ISO_RE.match(text)
+        if m:
+            frac = m[7]
+            return datetime(
+                int(m[1]), int(m[2]), int(m[3]), int(m[4]), int(m[5]), int(m[6]),
+                int(frac.ljust(6, "0")) if frac else 0,
+            )
+        m = _DT_US_RE.match(text)
+        if m:
+            hour = int(m[4]) % 12
+            if m[7].upper() == "PM":
+                hour += 12
+            return datetime(int(m[3]), int(m[1]), int(m[2]), hour, int(m[5]), int(m[6]))
+    except ValueError:
+        pass
     return None
 
 def _load_json(path: Path) -> Any:
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    # Decode straight from bytes; no intermediate str or stripped copy.
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    if not data or data.isspace():
         return None
     try:
-        with path.open("r", encoding="utf-8-sig") as f:
-            content = f.read().strip()
-            if not content:
-                return None
-            return json.loads(content)
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
     except Exception:
         return None
 
@@ -96,9 +143,13 @@ def _ensure_list(x: Any) -> List[Any]:
 
 def _coerce_event(obj: dict, log: str) -> Event:
     t = None
+    raw_t = None
     for k in TIME_KEYS:
         if k in obj:
-            t = _parse_dt(obj.get(k))
+            value = obj.get(k)
+            t = _parse_dt(value)
+            if t is not None and isinstance(value, str):
+                raw_t = value.strip()
             break
     eid = obj.get("Id")
     try:
@@ -111,65 +162,74 @@ def _coerce_event(obj: dict, log: str) -> Event:
     msg = str(obj.get("Message") or "").strip()
 
     # Basic message cleanup
-    msg = re.sub(r"\s+", " ", msg)
-    return Event(time=t, log=log, event_id=eid, level=level, provider=provider, message=msg)
+    msg = _WS_RE.sub(" ", msg)
+    return Event(time=t, log=log, event_id=eid, level=level, provider=provider, message=msg, raw_time=raw_t)
 
 def load_events(bundle_dir: Path) -> List[Event]:
     logs_dir = bundle_dir / "logs"
-    candidates = [
-        ("System", logs_dir / "system_events.json"),
-        ("Application", logs_dir / "application_events.json"),
-        ("SystemProviderFocus", logs_dir / "system_provider_focus.json"),
-        ("Reliability", logs_dir / "reliability_records.json"),
-        ("WEROperational", logs_dir / "wer_systemerrorreporting.json"),
-    ]
+    candidates = [(log_name, logs_dir / name) for log_name, name in LOG_FILES]
+
+    # Read/decode the exports concurrently (map keeps candidate order), then
+    # build events on this thread.
+    with ThreadPoolExecutor(max_workers=len(candidates)) as ex:
+        raws = list(ex.map(_load_json, [p for _, p in candidates]))
 
     events: List[Event] = []
-    for log_name, p in candidates:
-        raw = _load_json(p)
+    for (log_name, _), raw in zip(candidates, raws):
         for obj in _ensure_list(raw):
             if isinstance(obj, dict):
                 events.append(_coerce_event(obj, log_name))
-    # Sort by time (unknown times last)
-    events.sort(key=lambda e: (e.time is None, e.time or datetime.min))
-    return events
+    _parse_dt_str.cache_clear()
+    # Sort by time (unknown times last). Both sorts are stable, so partitioning
+    # first gives the same order without building a tuple key per event.
+    timed = [e for e in events if e.time is not None]
+    untimed = [e for e in events if e.time is None]
+    timed.sort(key=attrgetter("time"))
+    return timed + untimed
 
 def score_suspects(events: List[Event]) -> List[Tuple[str, int]]:
-    patterns = [
-        ("GPU driver reset (TDR) or display stack", r"(Display driver|nvlddmkm|amdkmdag|DXGI|TDR|LiveKernelEvent|VIDEO_TDR|GPU)"),
-        ("Kernel power / unexpected reboot", r"(Kernel-Power|Event ID 41|The system has rebooted without cleanly shutting down)"),
-        ("Bugcheck / BSOD style crash", r"(bugcheck|MEMORY\.DMP|minidump|BlueScreen|STOP_CODE|0x[0-9A-Fa-f]+)"),
-        ("WHEA hardware error (CPU, RAM, PCIe, GPU)", r"(WHEA|Machine Check Exception|Corrected hardware error)"),
-        ("Game or app crash/hang", r"(Faulting application|AppHang|Exception code|stopped working|ARC Raiders|UE4|Unreal)"),
-        ("Driver/service instability", r"(driver|service terminated|failed to start|DeviceSetupManager|Kernel-PnP)"),
-        ("Disk/FS instability", r"(disk|ntfs|volmgr|storahci|Reset to device|bad block|corruption)"),
-    ]
-
-    counts = {name: 0 for name, _ in patterns}
+    counts = {name: 0 for name in _SUSPECT_NAMES.values()}
     for e in events:
-        blob = f"{e.provider} {e.message}"
-        for name, pat in patterns:
-            if re.search(pat, blob, re.IGNORECASE):
-                counts[name] += 1
+        blob = f"{e.provider} {e.message}".lower()
+        hits = {slug for slug, literals in _SUSPECT_LITERALS if any(lit in blob for lit in literals)}
+        for slug, pattern in _SUSPECT_PATTERNS:
+            if slug not in hits and pattern.search(blob):
+                hits.add(slug)
+        for slug in hits:
+            counts[_SUSPECT_NAMES[slug]] += 1
 
     ranked = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
     return [(k, v) for k, v in ranked if v > 0]
 
-def extract_key_lines(events: List[Event], limit: int = 25) -> List[str]:
-    # Focused high-signal IDs and providers
-    high_ids = {41, 6008, 1001, 4101, 14, 13, 161, 219, 1000, 1002, 1026}
-    high_provider = re.compile(r"(Kernel-Power|WHEA|nvlddmkm|Display|BugCheck|Windows Error Reporting|Application Error)", re.IGNORECASE)
+def _format_time(e: Event) -> str:
+    if e.time is None:
+        return "UNKNOWN_TIME"
+    # ISO exports already carry "YYYY-MM-DD?HH:MM:SS"; reuse that prefix rather
+    # than re-rendering the parsed datetime.
+    raw = e.raw_time
+    if raw and len(raw) >= 19 and raw[4] == "-" and raw[7] == "-" and raw[10] in "T " and raw[13] == ":" and raw[16] == ":":
+        return raw[:19].replace("T", " ")
+    return e.time.isoformat(sep=" ", timespec="seconds")
 
-    picks: List[Event] = []
+def extract_key_lines(events: List[Event], limit: int = 25) -> List[str]:
+    # Keep last N most relevant
+    picks: deque[Event] = deque(maxlen=limit)
     for e in events:
-        if (e.event_id in high_ids) or high_provider.search(e.provider) or high_provider.search(e.message):
+        if e.event_id in _HIGH_IDS:
+            picks.append(e)
+            continue
+        # All tokens are literal, so plain substring checks replace the regex
+        prov_l = e.provider.lower()
+        if any(t in prov_l for t in _HIGH_PROVIDER_LITERALS):
+            picks.append(e)
+            continue
+        msg_l = e.message.lower()
+        if any(t in msg_l for t in _HIGH_PROVIDER_LITERALS):
             picks.append(e)
 
-    # Keep last N most relevant
-    picks = picks[-limit:]
     lines = []
     for e in picks:
-        t = e.time.isoformat(sep=" ", timespec="seconds") if e.time else "UNKNOWN_TIME"
+        t = _format_time(e)
         lines.append(f"[{t}] {e.log} ID={e.event_id} {e.provider}: {e.message}")
     return lines
 
@@ -185,24 +245,26 @@ def print_summary(bundle_dir: Path) -> int:
     first_t = next((e.time for e in events if e.time), None)
     last_t = next((e.time for e in reversed(events) if e.time), None)
 
-    print("CrashKit Summary")
-    print(f"Bundle: {bundle_dir}")
-    print(f"Events loaded: {len(events)}")
-    print(f"Time range: {first_t} .. {last_t}")
-    print("")
+    # Build the report and emit it with a single write
+    lines: List[str] = []
+    lines.append("CrashKit Summary")
+    lines.append(f"Bundle: {bundle_dir}")
+    lines.append(f"Events loaded: {len(events)}")
+    lines.append(f"Time range: {first_t} .. {last_t}")
+    lines.append("")
 
     if suspects:
-        print("Top suspect buckets (count of matching signals):")
-        for name, c in suspects[:6]:
-            print(f"- {name}: {c}")
-        print("")
+        lines.append("Top suspect buckets (count of matching signals):")
+        lines.extend(f"- {name}: {c}" for name, c in suspects[:6])
+        lines.append("")
     else:
-        print("No strong suspect patterns detected from exported events.")
-        print("")
+        lines.append("No strong suspect patterns detected from exported events.")
+        lines.append("")
+
+    lines.append("High-signal event lines:")
+    lines.extend(f"- {line}" for line in key_lines)
 
-    print("High-signal event lines:")
-    for line in key_lines:
-        print(f"- {line}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
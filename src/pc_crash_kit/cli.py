@@ -5,12 +5,10 @@ import json
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
-from .collect import collect
-from .doctor import doctor
-from .summarize import summarize
 from .utils import is_admin, is_wsl, load_config, wsl_to_windows_path, run_cmd
 
 DEFAULT_DOCTOR_CHECKS = {
@@ -278,10 +276,44 @@ def _with_admin_flags(argv: Sequence[str]) -> list[str]:
     return updated
 
 
+@lru_cache(maxsize=1)
 def _windows_repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=1)
+def _wsl_windows_repo() -> str:
+    return wsl_to_windows_path(_windows_repo_root())
+
+
+def _wsl_python_cmd() -> str:
+    win_py = os.environ.get("PC_CRASH_KIT_WIN_PY")
+    if win_py:
+        return f"& {_ps_quote(win_py)}"
+    return "py -3.12"
+
+
+def _build_ps_invocation(
+    win_repo: str, py_cmd: str, win_args: Sequence[str], elevated: bool
+) -> list[str]:
+    win_src = f"{win_repo}\\src"
+    win_args_str = " ".join(_ps_quote(arg) for arg in win_args)
+    ps = (
+        f"$env:PYTHONPATH={_ps_quote(win_src)}; "
+        f"Set-Location -Path {_ps_quote(win_repo)}; "
+        f"{py_cmd} -m pc_crash_kit.cli {win_args_str}"
+    )
+    if elevated:
+        command = (
+            "Start-Process PowerShell -Verb RunAs "
+            f"-WorkingDirectory {_ps_quote(win_repo)} "
+            f"-ArgumentList '-NoExit','-Command',{_ps_quote(ps)}"
+        )
+    else:
+        command = f"{ps}; exit $LASTEXITCODE"
+    return ["powershell.exe", "-NoProfile", "-Command", command]
+
+
 def _latest_bundle_dir(base: Path) -> Path | None:
     if not base.exists() or not base.is_dir():
         return None
@@ -299,96 +331,39 @@ def _latest_bundle_dir(base: Path) -> Path | None:
     return max(candidates, key=lambda p: p.stat().st_mtime)
 
 
-def _launch_elevated_windows(argv: Sequence[str]) -> int:
-    repo_root = _windows_repo_root()
-    win_repo = str(repo_root)
-    win_src = f"{win_repo}\\src"
-    win_args = _with_admin_flags(argv)
-    win_args_str = " ".join(_ps_quote(arg) for arg in win_args)
-    py_exe = sys.executable
-    ps = (
-        f"$env:PYTHONPATH={_ps_quote(win_src)}; "
-        f"Set-Location -Path {_ps_quote(win_repo)}; "
-        f"& {_ps_quote(py_exe)} -m pc_crash_kit.cli {win_args_str}"
-    )
-    start_cmd = (
-        "Start-Process PowerShell -Verb RunAs "
-        f"-WorkingDirectory {_ps_quote(win_repo)} "
-        f"-ArgumentList '-NoExit','-Command',{_ps_quote(ps)}"
-    )
-    result = run_cmd(
-        ["powershell.exe", "-NoProfile", "-Command", start_cmd],
-        capture=False,
-        check=False,
-    )
+def _launch_elevated(win_repo: str, py_cmd: str, argv: Sequence[str], failure: str) -> int:
+    cmd = _build_ps_invocation(win_repo, py_cmd, _with_admin_flags(argv), elevated=True)
+    result = run_cmd(cmd, capture=False, check=False)
     if result.returncode != 0:
-        print("Failed to launch elevated PowerShell.", file=sys.stderr)
+        print(failure, file=sys.stderr)
         return result.returncode
     print("Elevated run started in a new window.", file=sys.stderr)
     return 2
 
 
-def _launch_elevated_from_wsl(argv: Sequence[str]) -> int:
-    repo_root = _windows_repo_root()
-    win_repo = wsl_to_windows_path(repo_root)
-    win_src = f"{win_repo}\\src"
-    win_args = _with_admin_flags(argv)
-    win_args_str = " ".join(_ps_quote(arg) for arg in win_args)
+def _launch_elevated_windows(argv: Sequence[str]) -> int:
+    return _launch_elevated(
+        str(_windows_repo_root()),
+        f"& {_ps_quote(sys.executable)}",
+        argv,
+        "Failed to launch elevated PowerShell.",
+    )
 
-    win_py = os.environ.get("PC_CRASH_KIT_WIN_PY")
-    if win_py:
-        py_cmd = f"& {_ps_quote(win_py)}"
-    else:
-        py_cmd = "py -3.12"
 
-    ps = (
-        f"$env:PYTHONPATH={_ps_quote(win_src)}; "
-        f"Set-Location -Path {_ps_quote(win_repo)}; "
-        f"{py_cmd} -m pc_crash_kit.cli {win_args_str}"
-    )
-    start_cmd = (
-        "Start-Process PowerShell -Verb RunAs "
-        f"-WorkingDirectory {_ps_quote(win_repo)} "
-        f"-ArgumentList '-NoExit','-Command',{_ps_quote(ps)}"
-    )
-    result = run_cmd(
-        ["powershell.exe", "-NoProfile", "-Command", start_cmd],
-        capture=False,
-        check=False,
+def _launch_elevated_from_wsl(argv: Sequence[str]) -> int:
+    return _launch_elevated(
+        _wsl_windows_repo(),
+        _wsl_python_cmd(),
+        argv,
+        "Failed to launch elevated PowerShell from WSL.",
     )
-    if result.returncode != 0:
-        print("Failed to launch elevated PowerShell from WSL.", file=sys.stderr)
-        return result.returncode
-    print("Elevated run started in a new window.", file=sys.stderr)
-    return 2
 
 
 def _delegate_to_windows(argv: Sequence[str]) -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    win_repo = wsl_to_windows_path(repo_root)
-    win_src = f"{win_repo}\\src"
-
-    win_args = _convert_wsl_args(argv)
-    win_args_str = " ".join(_ps_quote(arg) for arg in win_args)
-
-    win_py = os.environ.get("PC_CRASH_KIT_WIN_PY")
-    if win_py:
-        py_cmd = f"& {_ps_quote(win_py)}"
-    else:
-        py_cmd = "py -3.12"
-
-    ps = (
-        f"$env:PYTHONPATH={_ps_quote(win_src)}; "
-        f"Set-Location -Path {_ps_quote(win_repo)}; "
-        f"{py_cmd} -m pc_crash_kit.cli {win_args_str}; "
-        "exit $LASTEXITCODE"
-    )
-
-    result = run_cmd(
-        ["powershell.exe", "-NoProfile", "-Command", ps],
-        capture=False,
-        check=False,
+    cmd = _build_ps_invocation(
+        _wsl_windows_repo(), _wsl_python_cmd(), _convert_wsl_args(argv), elevated=False
     )
+    result = run_cmd(cmd, capture=False, check=False)
     if result.returncode == 127:
         print(
             "WSL detected but failed to launch Windows Python. "
@@ -415,7 +390,7 @@ def _print_admin_instructions(argv: Sequence[str]) -> None:
     print(f"python -m pc_crash_kit.cli {args}", file=sys.stderr)
 
     if is_wsl():
-        win_repo = wsl_to_windows_path(repo_root)
+        win_repo = _wsl_windows_repo()
         win_cmd = (
             "powershell.exe -NoProfile -Command "
             "\"Start-Process PowerShell -Verb RunAs -ArgumentList '-NoExit','-Command',"
@@ -427,8 +402,7 @@ def _print_admin_instructions(argv: Sequence[str]) -> None:
 
 
 def _print_wsl_instructions(argv: Sequence[str]) -> None:
-    repo_root = _windows_repo_root()
-    win_repo = wsl_to_windows_path(repo_root)
+    win_repo = _wsl_windows_repo()
     helper = f"{win_repo}\\scripts\\pc-crash-kit.ps1"
     args = " ".join(_with_admin_flags(argv))
 
@@ -462,7 +436,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.command == "collect" and not is_admin():
         _print_admin_instructions(argv)
 
+    # Subcommand modules are imported on demand to keep --help and dispatch fast.
     if args.command == "collect":
+        from .collect import collect
+
         try:
             manifest = collect(
                 output_dir=args.output,
@@ -499,6 +476,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 0
 
     if args.command == "summarize":
+        from .summarize import summarize
+
         bundle_dir = args.bundle_dir
         if bundle_dir is None:
             bundle_dir = _latest_bundle_dir(Path("artifacts"))
@@ -516,6 +495,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         return 0
 
     if args.command == "doctor":
+        from .doctor import doctor
+
         if args.full and args.minimal:
             print("Choose only one of --full or --minimal.", file=sys.stderr)
             return 2
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import fnmatch
 import glob
-import json
+import heapq
 import logging
 import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 from .utils import (
     CopyReport,
     ensure_dir,
+    entry_is_dir,
+    entry_is_file,
+    entry_stat,
     is_admin,
     is_windows,
+    json_bytes,
     load_config,
     run_cmd,
     timestamp_now,
@@ -42,84 +52,81 @@ LIVE_KERNEL_FOLDERS = [
 DEFAULT_LATEST_N = 3
 DEFAULT_MAX_DUMP_GB = 1
 DEFAULT_EVENTLOG_HOURS = 24
+EVENT_LOGS = ("System", "Application")
+EVENTLOG_BACKENDS = ("wevtutil", "ps1")
+COPY_WORKERS = min(8, (os.cpu_count() or 1) * 2)
 
 
-def _sorted_by_mtime(paths: Iterable[Path]) -> list[Path]:
-    def _mtime(path: Path) -> float:
-        try:
-            return path.stat().st_mtime if path.exists() else 0.0
-        except OSError:
-            return 0.0
+def _try_scandir(base: Path, strict_access: bool) -> list[os.DirEntry]:
+    # Open the directory directly; a missing base is not an error, so there is
+    # no separate exists() probe.
+    try:
+        with os.scandir(base) as it:
+            return list(it)
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        if strict_access:
+            raise
+        logger.warning("Unable to list %s: %s", base, exc)
+        return []
+
+
+def _entry_mtime(entry: os.DirEntry) -> float:
+    st = entry_stat(entry)
+    return st.st_mtime if st else 0.0
+
 
-    return sorted(paths, key=_mtime)
+def _latest_entries(entries: Iterable[os.DirEntry], latest_n: int) -> list[Path]:
+    entries = list(entries)
+    if len(entries) <= latest_n:
+        # Everything is selected, so skip the stat calls. Sort by name so the
+        # copy and manifest order don't depend on the filesystem's listing.
+        return sorted(Path(e.path) for e in entries)
+    # O(N log n) selection of the newest entries, returned oldest first.
+    newest = heapq.nlargest(latest_n, ((_entry_mtime(e), e.path) for e in entries), key=itemgetter(0))
+    return [Path(path) for _, path in reversed(newest)]
+
+
+@lru_cache(maxsize=32)
+def _name_matcher(patterns: tuple[str, ...]) -> Callable[[str], object]:
+    # Windows names compare case-insensitively, as fnmatch does there.
+    fold = os.name == "nt"
+    stems = [p[:-1] for p in patterns if p.endswith("*")]
+    if len(stems) == len(patterns) and not any(c in stem for stem in stems for c in "*?["):
+        # Plain "Prefix_*" patterns (the WER defaults) need only startswith.
+        if fold:
+            prefixes = tuple(stem.lower() for stem in stems)
+            return lambda name: name.lower().startswith(prefixes)
+        prefixes = tuple(stems)
+        return lambda name: name.startswith(prefixes)
+    # Otherwise one union regex for all patterns.
+    flags = re.IGNORECASE if fold else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags).match
 
 
 def find_latest_dirs(
     base: Path, patterns: list[str], latest_n: int, strict_access: bool = False
 ) -> list[Path]:
-    try:
-        if not base.exists():
-            return []
-    except OSError as exc:
-        if strict_access:
-            raise
-        logger.warning("Unable to access %s: %s", base, exc)
+    if not patterns:
         return []
-    matches: list[Path] = []
-    for pat in patterns:
-        try:
-            matches.extend([p for p in base.glob(pat) if p.is_dir()])
-        except OSError as exc:
-            if strict_access:
-                raise
-            logger.warning("Unable to glob %s in %s: %s", pat, base, exc)
-    ordered = _sorted_by_mtime(matches)
-    return ordered[-latest_n:]
+    match = _name_matcher(tuple(patterns))
+    # One directory listing, one regex test per entry.
+    entries = _try_scandir(base, strict_access)
+    return _latest_entries((e for e in entries if match(e.name) and entry_is_dir(e)), latest_n)
 
 
 def find_latest_files(
     base: Path, latest_n: int, strict_access: bool = False
 ) -> list[Path]:
-    try:
-        if not base.exists():
-            return []
-    except OSError as exc:
-        if strict_access:
-            raise
-        logger.warning("Unable to access %s: %s", base, exc)
-        return []
-    try:
-        files = [p for p in base.iterdir() if p.is_file()]
-    except OSError as exc:
-        if strict_access:
-            raise
-        logger.warning("Unable to list files in %s: %s", base, exc)
-        return []
-    ordered = _sorted_by_mtime(files)
-    return ordered[-latest_n:]
+    entries = _try_scandir(base, strict_access)
+    return _latest_entries((e for e in entries if entry_is_file(e)), latest_n)
 
 
 def find_latest_file_in_subdir(
     base: Path, subdir: str, latest_n: int, strict_access: bool = False
 ) -> list[Path]:
-    folder = base / subdir
-    try:
-        if not folder.exists():
-            return []
-    except OSError as exc:
-        if strict_access:
-            raise
-        logger.warning("Unable to access %s: %s", folder, exc)
-        return []
-    try:
-        files = [p for p in folder.iterdir() if p.is_file()]
-    except OSError as exc:
-        if strict_access:
-            raise
-        logger.warning("Unable to list files in %s: %s", folder, exc)
-        return []
-    ordered = _sorted_by_mtime(files)
-    return ordered[-latest_n:] if ordered else []
+    return find_latest_files(base / subdir, latest_n, strict_access=strict_access)
 
 
 def _normalize_list(value: object) -> list[str]:
@@ -130,10 +137,14 @@ def _normalize_list(value: object) -> list[str]:
     return [str(value)]
 
 
+# Config entries often repeat across groups. _expand_path depends on the
+# environment, so _copy_custom_groups clears it for each run.
+@lru_cache(maxsize=4096)
 def _expand_path(raw: str) -> Path:
     return Path(os.path.expandvars(raw)).expanduser()
 
 
+@lru_cache(maxsize=4096)
 def _safe_relpath(path: Path) -> Path:
     try:
         if path.is_absolute() and path.anchor:
@@ -155,11 +166,12 @@ def _copy_custom_paths(
     globs: list[str],
 ) -> dict:
     custom_root = ensure_dir(dest_root)
+    custom_root_s = str(custom_root)
     matched: list[str] = []
 
     for raw in files:
         src = _expand_path(raw)
-        dest = custom_root / _safe_relpath(src)
+        dest = os.path.join(custom_root_s, _safe_relpath(src))
         copy_file_with_limit(
             src, dest, report, max_bytes=max_bytes, include_large_dumps=include_large_dumps
         )
@@ -173,12 +185,13 @@ def _copy_custom_paths(
 
     for pattern in globs:
         expanded = os.path.expandvars(pattern)
-        for match in glob.glob(expanded, recursive=True):
-            src = Path(match)
-            if not src.is_file():
+        # Stream matches into the copy loop; only "**" needs the recursive walker.
+        for match in glob.iglob(expanded, recursive="**" in expanded):
+            if not os.path.isfile(match):
                 continue
+            src = Path(match)
             matched.append(match)
-            dest = custom_root / _safe_relpath(src)
+            dest = os.path.join(custom_root_s, _safe_relpath(src))
             copy_file_with_limit(
                 src, dest, report, max_bytes=max_bytes, include_large_dumps=include_large_dumps
             )
@@ -196,6 +209,7 @@ def _copy_custom_groups(
     if not groups:
         return {}
 
+    _expand_path.cache_clear()
     summary: dict[str, dict] = {}
     for name, spec in groups.items():
         if not isinstance(spec, dict):
@@ -217,13 +231,39 @@ def _copy_custom_groups(
     return summary
 
 
-def export_event_logs(dest_dir: Path, hours: int) -> list[str]:
-    ensure_dir(dest_dir)
-    outputs: list[str] = []
-    if not is_windows():
-        logger.warning("Not running on Windows, skipping event log export.")
-        return outputs
+def _run_copy_task(
+    task: tuple[str, Path, Path | str], max_bytes: int, include_large_dumps: bool
+) -> CopyReport:
+    kind, src, dest = task
+    task_report = CopyReport(copied=[], skipped_large=[], missing=[])
+    copier = copy_dir_with_limit if kind == "dir" else copy_file_with_limit
+    copier(src, dest, task_report, max_bytes=max_bytes, include_large_dumps=include_large_dumps)
+    return task_report
+
+
+def _export_with_wevtutil(dest_dir: Path, hours: int) -> None:
+    ms = int(hours * 3600 * 1000)
+    query = f"*[System[TimeCreated[timediff(@SystemTime) <= {ms}]]]"
+    # Each export walks its own EVTX file, so start them all before waiting.
+    procs: list[tuple[str, subprocess.Popen]] = []
+    for log in EVENT_LOGS:
+        cmd = ["wevtutil.exe", "epl", log, str(dest_dir / f"{log}.evtx"), f"/q:{query}"]
+        logger.debug("Running command: %s", " ".join(cmd))
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+        except OSError as exc:
+            logger.warning("Failed to export %s event log: %s", log, exc)
+            continue
+        procs.append((log, proc))
+    for log, proc in procs:
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            logger.warning("Failed to export %s event log: %s", log, (stderr or "").strip())
+
 
+def _export_with_script(dest_dir: Path, hours: int) -> None:
     script = Path(__file__).resolve().parents[2] / "scripts" / "export-eventlogs.ps1"
     cmd = [
         "powershell.exe",
@@ -240,14 +280,28 @@ def export_event_logs(dest_dir: Path, hours: int) -> list[str]:
     result = run_cmd(cmd, capture=True, check=False)
     if result.returncode != 0:
         logger.warning("Failed to export event logs: %s", result.stderr.strip())
+
+
+def export_event_logs(dest_dir: Path, hours: int, backend: str = "wevtutil") -> list[str]:
+    if backend not in EVENTLOG_BACKENDS:
+        raise ValueError(f"Unknown event log backend: {backend}")
+    ensure_dir(dest_dir)
+    outputs: list[str] = []
+    if not is_windows():
+        logger.warning("Not running on Windows, skipping event log export.")
         return outputs
 
-    system_path = dest_dir / "System.evtx"
-    app_path = dest_dir / "Application.evtx"
-    if system_path.exists():
-        outputs.append(str(system_path))
-    if app_path.exists():
-        outputs.append(str(app_path))
+    # "wevtutil" calls wevtutil.exe directly; "ps1" goes through
+    # scripts/export-eventlogs.ps1 and pays for a PowerShell start-up.
+    if backend == "wevtutil":
+        _export_with_wevtutil(dest_dir, hours)
+    else:
+        _export_with_script(dest_dir, hours)
+
+    for log in EVENT_LOGS:
+        path = dest_dir / f"{log}.evtx"
+        if path.exists():
+            outputs.append(str(path))
     return outputs
 
 
@@ -297,53 +351,49 @@ def collect(
     cfg_wer = config.get("wer", {})
     patterns = wer_patterns or _normalize_list(cfg_wer.get("patterns")) or WER_PATTERNS
     wer_dirs = find_latest_dirs(wer_base, patterns, latest_n, strict_access=strict)
-    for d in wer_dirs:
-        copy_dir_with_limit(
-            d,
-            wer_dest / d.name,
-            report,
-            max_bytes=max_bytes,
-            include_large_dumps=include_large_dumps,
-        )
+    tasks: list[tuple[str, Path, Path | str]] = [("dir", d, wer_dest / d.name) for d in wer_dirs]
+
+    # File destinations are joined as plain strings from precomputed roots.
+    live_dest_s = str(live_dest)
+    mini_dest_s = str(mini_dest)
 
     cfg_live = config.get("livekernel", {})
     live_folders = _normalize_list(cfg_live.get("folders")) or LIVE_KERNEL_FOLDERS
     for sub in live_folders:
+        sub_dest_s = os.path.join(live_dest_s, sub)
         for f in find_latest_file_in_subdir(
             live_base, sub, live_n, strict_access=strict
         ):
-            dest = live_dest / sub / f.name
-            copy_file_with_limit(
-                f,
-                dest,
-                report,
-                max_bytes=max_bytes,
-                include_large_dumps=include_large_dumps,
-            )
+            tasks.append(("file", f, os.path.join(sub_dest_s, f.name)))
 
     for f in find_latest_files(mini_base, mini_n, strict_access=strict):
-        dest = mini_dest / f.name
-        copy_file_with_limit(
-            f,
-            dest,
-            report,
-            max_bytes=max_bytes,
-            include_large_dumps=include_large_dumps,
-        )
+        tasks.append(("file", f, os.path.join(mini_dest_s, f.name)))
 
     cfg_custom = config.get("custom", {})
     if not isinstance(cfg_custom, dict):
         logger.warning("Config [custom] must be a table of groups.")
         cfg_custom = {}
-    custom_report = _copy_custom_groups(
-        output_dir,
-        report,
-        max_bytes=max_bytes,
-        include_large_dumps=include_large_dumps,
-        groups=cfg_custom,
-    )
 
-    event_logs = export_event_logs(output_dir / "eventlogs", hours=hours)
+    # Copies are independent blocking I/O, so run them on a pool alongside the
+    # event log export. Each task reports into its own CopyReport; merging in
+    # task order keeps the manifest deterministic.
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        event_logs_future = ex.submit(export_event_logs, output_dir / "eventlogs", hours)
+        copy_one = partial(
+            _run_copy_task, max_bytes=max_bytes, include_large_dumps=include_large_dumps
+        )
+        for task_report in ex.map(copy_one, tasks):
+            report.extend(task_report)
+
+        custom_report = _copy_custom_groups(
+            output_dir,
+            report,
+            max_bytes=max_bytes,
+            include_large_dumps=include_large_dumps,
+            groups=cfg_custom,
+        )
+
+        event_logs = event_logs_future.result()
 
     manifest = {
         "output_dir": str(output_dir),
@@ -364,11 +414,11 @@ def collect(
         "is_admin": is_admin(),
         "event_logs": event_logs,
         "custom": custom_report,
-        "copy_report": json.loads(report.to_json()),
+        "copy_report": report.to_dict(),
     }
 
     manifest_path = output_dir / "manifest.json"
     manifest["manifest_path"] = str(manifest_path)
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    manifest_path.write_bytes(json_bytes(manifest))
 
     return manifest
@@ -2,16 +2,41 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from .utils import ensure_dir, is_admin, is_windows, run_cmd, timestamp_now
+from .utils import ensure_dir, is_admin, is_windows, json_bytes, run_cmd, timestamp_now
 
 logger = logging.getLogger(__name__)
 
 
+# doctor-checks.ps1 switch for each check, in the order results are reported.
+CHECK_FLAGS = {
+    "systeminfo": "-SystemInfo",
+    "system_info": "-SystemSnapshot",
+    "dxdiag": "-DxDiag",
+    "msinfo": "-MsInfo",
+    "drivers": "-Drivers",
+    "hotfixes": "-Hotfixes",
+    "crash_config": "-CrashConfig",
+    "sfc": "-RunSfc",
+    "dism_scan": "-DismScan",
+    "dism_restore": "-DismRestore",
+}
+
+# These contend on the component store (CBS), so they stay serialized after
+# the independent checks.
+SERIAL_CHECKS = ("sfc", "dism_scan", "dism_restore")
+
+_LIST_KEYS = ("commands", "skipped", "errors")
+# Per-run failure diagnostics. A single value stays a plain string, as in a
+# one-run manifest; values from several runs become a list in run order.
+_DIAGNOSTIC_KEYS = ("stderr", "raw")
+
+
 def _run_doctor_script(
     output_dir: Path,
-    checks: dict[str, bool],
+    flags: list[str],
 ) -> dict:
     script = Path(__file__).resolve().parents[2] / "scripts" / "doctor-checks.ps1"
     cmd = [
@@ -23,27 +48,8 @@ def _run_doctor_script(
         str(script),
         "-OutputDir",
         str(output_dir),
+        *flags,
     ]
-    if checks.get("systeminfo"):
-        cmd.append("-SystemInfo")
-    if checks.get("system_info"):
-        cmd.append("-SystemSnapshot")
-    if checks.get("dxdiag"):
-        cmd.append("-DxDiag")
-    if checks.get("msinfo"):
-        cmd.append("-MsInfo")
-    if checks.get("drivers"):
-        cmd.append("-Drivers")
-    if checks.get("hotfixes"):
-        cmd.append("-Hotfixes")
-    if checks.get("crash_config"):
-        cmd.append("-CrashConfig")
-    if checks.get("sfc"):
-        cmd.append("-RunSfc")
-    if checks.get("dism_scan"):
-        cmd.append("-DismScan")
-    if checks.get("dism_restore"):
-        cmd.append("-DismRestore")
 
     result = run_cmd(cmd, capture=True, check=False)
     raw = (result.stdout or "").strip()
@@ -75,6 +81,54 @@ def _run_doctor_script(
     }
 
 
+def _as_list(value: object) -> list:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _merge_results(results: list[dict]) -> dict:
+    merged: dict = {}
+    for payload in results:
+        for key, value in payload.items():
+            if key in _LIST_KEYS:
+                merged.setdefault(key, []).extend(_as_list(value))
+            elif key in _DIAGNOSTIC_KEYS:
+                if value:
+                    merged.setdefault(key, []).append(value)
+            else:
+                merged.setdefault(key, value)
+    for key in _LIST_KEYS:
+        merged.setdefault(key, [])
+    for key in _DIAGNOSTIC_KEYS:
+        if len(merged.get(key, ())) == 1:
+            merged[key] = merged[key][0]
+    return merged
+
+
+def _run_doctor_checks(
+    output_dir: Path,
+    checks: dict[str, bool],
+) -> dict:
+    enabled = [name for name in CHECK_FLAGS if checks.get(name)]
+    independent = [name for name in enabled if name not in SERIAL_CHECKS]
+    serial = [name for name in enabled if name in SERIAL_CHECKS]
+
+    # Each independent check gets its own script run so the slow ones
+    # (systeminfo, dxdiag, msinfo32) overlap; map keeps the report order.
+    results: list[dict] = []
+    if independent:
+        with ThreadPoolExecutor(max_workers=len(independent)) as ex:
+            results.extend(
+                ex.map(lambda name: _run_doctor_script(output_dir, [CHECK_FLAGS[name]]), independent)
+            )
+    if serial or not results:
+        results.append(_run_doctor_script(output_dir, [CHECK_FLAGS[name] for name in serial]))
+    return _merge_results(results)
+
+
 def doctor(
     output_dir: Path | None,
     checks: dict[str, bool],
@@ -92,7 +146,7 @@ def doctor(
         }
         return result
 
-    result = _run_doctor_script(output_dir, checks)
+    result = _run_doctor_checks(output_dir, checks)
     if "output_dir" not in result:
         result["output_dir"] = str(output_dir)
     result.setdefault(
@@ -100,8 +154,6 @@ def doctor(
         [name for name, enabled in checks.items() if enabled],
     )
 
-    (output_dir / "doctor_manifest.json").write_text(
-        json.dumps(result, indent=2), encoding="utf-8"
-    )
+    (output_dir / "doctor_manifest.json").write_bytes(json_bytes(result))
 
     return result
@@ -1,27 +1,79 @@
 from __future__ import annotations
 
+import codecs
 import csv
 import json
 import logging
+import os
 import platform
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-from .utils import ensure_dir, format_bytes, is_windows, run_cmd, timestamp_now
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+try:
+    import charset_normalizer  # optional: better guesses for non-UTF text
+except ImportError:
+    charset_normalizer = None
+
+from .utils import (
+    ensure_dir,
+    entry_is_file,
+    entry_stat,
+    format_bytes,
+    is_windows,
+    json_bytes,
+    run_cmd,
+    scandir_walk,
+    timestamp_now,
+)
 
 logger = logging.getLogger(__name__)
 
+_SIG_RE = re.compile(r"Sig\[(\d+)\]\.(Value|Name)")
+_NS_VALUE_RE = re.compile(r"Ns\[(\d+)\]\.Value")
 
-def _read_text_guess(path: Path) -> str:
-    for enc in ("utf-16", "utf-8-sig", "utf-8", "latin-1"):
-        try:
-            return path.read_text(encoding=enc)
-        except Exception:
-            continue
-    return ""
+PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+PARSE_BATCH = PARSE_WORKERS * 4
 
 
+def _read_text_guess(path: Path) -> str:
+    # One read; the encoding comes from the BOM when there is one.
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return ""
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        try:
+            return raw.decode("utf-16")
+        except UnicodeDecodeError:
+            pass
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    elif b"\x00" in raw[:64]:
+        # BOM-less UTF-16LE (systeminfo/Out-File redirection). NULs are valid
+        # UTF-8, so this has to be caught before the UTF-8 attempt.
+        try:
+            return raw.decode("utf-16-le")
+        except UnicodeDecodeError:
+            pass
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw).best()
+        if best is not None:
+            return str(best)
+    return raw.decode("latin-1")
+
+
+# The PowerShell snapshot takes about a second to start, and the machine does
+# not change within a run, so repeat callers share one result.
+@lru_cache(maxsize=1)
 def _load_system_info() -> dict[str, Any]:
     if not is_windows():
         return {
@@ -63,50 +115,89 @@ def _load_system_info() -> dict[str, Any]:
         return {"error": msg, "raw": raw[:500], "stderr": (result.stderr or "").strip(), "os": {}, "gpu": []}
 
 
-def _find_latest_named_file(base: Path, filename: str) -> Path | None:
-    matches = [
-        p for p in base.rglob("*") if p.is_file() and p.name.lower() == filename.lower()
-    ]
-    if not matches:
-        return None
-    return max(matches, key=lambda p: p.stat().st_mtime)
+_LATEST_NAMED = ("sysinfo.txt", "memory.csv")
+
+
+def _scan_bundle(bundle_dir: Path) -> dict[str, Any]:
+    # One walk of the bundle serves every lookup summarize needs. Sizes and
+    # mtimes come from the DirEntry, so nothing is stat'ed twice.
+    wer_top, live_top, mini_top = (
+        os.path.normcase(name) for name in ("wer", "livekernelreports", "minidump")
+    )
+    report_name = os.path.normcase("Report.wer")
+    dmp_suffix = os.path.normcase(".dmp")
+    prefix_len = len(os.path.join(str(bundle_dir), ""))
+
+    wer_reports: list[Path] = []
+    livekernel: list[tuple[str, int]] = []
+    minidump: list[tuple[str, int]] = []
+    latest: dict[str, tuple[str, float]] = {}
+
+    for entry in (e for _, entries in scandir_walk(str(bundle_dir)) for e in entries):
+        parts = os.path.normcase(entry.path[prefix_len:]).split(os.sep)
+        top, name = parts[0], parts[-1]
+        if top == wer_top and len(parts) > 1 and name == report_name:
+            wer_reports.append(Path(entry.path))
+        elif top == mini_top and len(parts) == 2 and name.endswith(dmp_suffix):
+            st = entry_stat(entry)
+            minidump.append((entry.path, st.st_size if st else 0))
+
+        # Only LiveKernel files and the named lookups need anything further,
+        # so most entries stop here without a type check.
+        in_live = top == live_top and len(parts) > 1
+        lower = entry.name.lower()
+        if not in_live and lower not in _LATEST_NAMED:
+            continue
+        if not entry_is_file(entry):
+            continue
+        if in_live:
+            st = entry_stat(entry)
+            livekernel.append((entry.path, st.st_size if st else 0))
+        if lower in _LATEST_NAMED:
+            st = entry_stat(entry)
+            mtime = st.st_mtime if st else 0.0
+            if lower not in latest or mtime > latest[lower][1]:
+                latest[lower] = (entry.path, mtime)
+
+    def _latest_path(name: str) -> Path | None:
+        return Path(latest[name][0]) if name in latest else None
+
+    return {
+        "wer_reports": wer_reports,
+        "livekernel": livekernel,
+        "minidump": minidump,
+        "sysinfo": _latest_path("sysinfo.txt"),
+        "memory_csv": _latest_path("memory.csv"),
+    }
 
 
 def _parse_sysinfo_text(text: str) -> dict[str, Any]:
-    data: dict[str, Any] = {}
-    current_key: str | None = None
+    # Each key maps to one fragment list per occurrence; continuation lines
+    # append to the latest one and everything is joined once at the end.
+    fragments: dict[str, list[list[str]]] = {}
+    current: list[str] | None = None
     for line in text.splitlines():
-        if not line.strip():
+        line = line.strip()
+        if not line:
             continue
-        if ":" in line:
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
+        key, sep, value = line.partition(":")
+        if sep:
+            key = key.rstrip()
             if not key:
                 continue
-            if key in data:
-                existing = data[key]
-                if isinstance(existing, list):
-                    existing.append(value)
-                else:
-                    data[key] = [existing, value]
-            else:
-                data[key] = value
-            current_key = key
-        elif current_key:
-            extra = line.strip()
-            if not extra:
-                continue
-            existing = data.get(current_key, "")
-            if isinstance(existing, list):
-                existing[-1] = f"{existing[-1]} {extra}".strip()
-            else:
-                data[current_key] = f"{existing} {extra}".strip()
+            current = [value.lstrip()]
+            fragments.setdefault(key, []).append(current)
+        elif current is not None:
+            current.append(line)
+
+    data: dict[str, Any] = {}
+    for key, occurrences in fragments.items():
+        values = [" ".join(filter(None, frags)) for frags in occurrences]
+        data[key] = values[0] if len(values) == 1 else values
     return data
 
 
-def _load_sysinfo(bundle_dir: Path) -> dict[str, Any] | None:
-    path = _find_latest_named_file(bundle_dir, "sysinfo.txt")
+def _load_sysinfo(path: Path | None) -> dict[str, Any] | None:
     if not path:
         return None
     text = _read_text_guess(path)
@@ -115,8 +206,7 @@ def _load_sysinfo(bundle_dir: Path) -> dict[str, Any] | None:
     return {"path": str(path), "data": _parse_sysinfo_text(text)}
 
 
-def _load_memory_csv(bundle_dir: Path) -> dict[str, Any] | None:
-    path = _find_latest_named_file(bundle_dir, "memory.csv")
+def _load_memory_csv(path: Path | None) -> dict[str, Any] | None:
     if not path:
         return None
     try:
@@ -137,24 +227,23 @@ def parse_wer_report(path: Path) -> dict[str, Any]:
 
     for line in raw.splitlines():
         line = line.strip()
-        if not line or "=" not in line:
+        key, sep, value = line.partition("=")
+        if not sep:
             continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
+        key = key.rstrip()
+        value = value.lstrip()
         data[key] = value
 
-        m = re.match(r"Sig\[(\d+)\]\.Value", key)
-        if m:
-            sig_values[m.group(1)] = value
-            continue
-        m = re.match(r"Sig\[(\d+)\]\.Name", key)
-        if m:
-            sig_names[m.group(1)] = value
-            continue
-        m = re.match(r"Ns\[(\d+)\]\.Value", key)
-        if m:
-            ns_values[m.group(1)] = value
+        # Most keys are neither Sig[...] nor Ns[...]; only those reach a regex.
+        if key.startswith("Sig["):
+            m = _SIG_RE.match(key)
+            if m:
+                target = sig_values if m.group(2) == "Value" else sig_names
+                target[m.group(1)] = value
+        elif key.startswith("Ns["):
+            m = _NS_VALUE_RE.match(key)
+            if m:
+                ns_values[m.group(1)] = value
 
     stop_code = None
     for key in ("StopCode", "Stopcode", "Code", "BugcheckCode", "Bugcheck"):
@@ -196,40 +285,74 @@ def _signature_key(report: dict[str, Any]) -> str:
     return "Unknown"
 
 
-def _collect_artifact_stats(bundle_dir: Path) -> dict[str, Any]:
-    stats: dict[str, Any] = {}
+def _largest(files: list[tuple[str, int]]) -> dict[str, str]:
+    path, size = max(files, key=itemgetter(1))
+    return {"path": path, "size": format_bytes(size)}
 
-    wer_dir = bundle_dir / "wer"
-    reports = list(wer_dir.rglob("Report.wer")) if wer_dir.exists() else []
 
-    live_dir = bundle_dir / "livekernelreports"
-    live_files = list(live_dir.rglob("*")) if live_dir.exists() else []
-    live_files = [p for p in live_files if p.is_file()]
+def _collect_artifact_stats(scan: dict[str, Any]) -> dict[str, Any]:
+    stats: dict[str, Any] = {}
 
-    mini_dir = bundle_dir / "minidump"
-    mini_files = list(mini_dir.glob("*.dmp")) if mini_dir.exists() else []
+    live_files = scan["livekernel"]
+    mini_files = scan["minidump"]
 
-    stats["wer_report_count"] = len(reports)
+    stats["wer_report_count"] = len(scan["wer_reports"])
     stats["livekernel_files"] = len(live_files)
     stats["minidump_files"] = len(mini_files)
 
     if live_files:
-        largest = max(live_files, key=lambda p: p.stat().st_size)
-        stats["largest_livekernel_file"] = {
-            "path": str(largest),
-            "size": format_bytes(largest.stat().st_size),
-        }
+        stats["largest_livekernel_file"] = _largest(live_files)
 
     if mini_files:
-        largest = max(mini_files, key=lambda p: p.stat().st_size)
-        stats["largest_minidump_file"] = {
-            "path": str(largest),
-            "size": format_bytes(largest.stat().st_size),
-        }
+        stats["largest_minidump_file"] = _largest(mini_files)
 
     return stats
 
 
+def _write_json_member(f: BinaryIO, key: str, value: Any, first: bool) -> None:
+    f.write(b"\n  " if first else b",\n  ")
+    f.write(json_bytes(key) + b": " + json_bytes(value).replace(b"\n", b"\n  "))
+
+
+def _write_summary_json(
+    path: Path,
+    head: dict[str, Any],
+    reports: Iterable[dict[str, Any]],
+    tail: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    # Writes head, then each report as it is produced, then the tail (which
+    # may depend on the reports). Layout matches indent=2 output. The stream
+    # goes to a temp file that replaces path only once everything is written,
+    # so a failing report or tail never leaves a truncated summary.json.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(b"{")
+            first = True
+            for key, value in head.items():
+                _write_json_member(f, key, value, first)
+                first = False
+
+            f.write(b"\n  " if first else b",\n  ")
+            f.write(b'"reports": [')
+            empty = True
+            for report in reports:
+                f.write(b"\n    " if empty else b",\n    ")
+                f.write(json_bytes(report).replace(b"\n", b"\n    "))
+                empty = False
+            f.write(b"]" if empty else b"\n  ]")
+
+            tail_values = tail()
+            for key, value in tail_values.items():
+                _write_json_member(f, key, value, False)
+            f.write(b"\n}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tail_values
+
+
 def summarize(bundle_dir: Path, output_dir: Path | None = None) -> dict[str, str]:
     bundle_dir = bundle_dir.resolve()
     if not bundle_dir.exists():
@@ -240,20 +363,13 @@ def summarize(bundle_dir: Path, output_dir: Path | None = None) -> dict[str, str
         output_dir = bundle_dir
     ensure_dir(output_dir)
 
-    wer_dir = bundle_dir / "wer"
-    report_paths = list(wer_dir.rglob("Report.wer")) if wer_dir.exists() else []
-    reports = [parse_wer_report(p) for p in report_paths]
+    # Start the PowerShell snapshot first so it overlaps the bundle walk and
+    # report parsing; it is only needed for the trailing summary keys.
+    pool = ThreadPoolExecutor(max_workers=1)
+    system_info_future = pool.submit(_load_system_info)
+    pool.shutdown(wait=False)
 
-    signature_counts: dict[str, int] = {}
-    for report in reports:
-        key = _signature_key(report)
-        signature_counts[key] = signature_counts.get(key, 0) + 1
-
-    signature_list = sorted(
-        [{"signature": k, "count": v} for k, v in signature_counts.items()],
-        key=lambda item: item["count"],
-        reverse=True,
-    )
+    scan = _scan_bundle(bundle_dir)
 
     manifest_path = bundle_dir / "manifest.json"
     manifest = None
@@ -263,39 +379,57 @@ def summarize(bundle_dir: Path, output_dir: Path | None = None) -> dict[str, str
         except Exception:
             manifest = None
 
-    system_info = _load_system_info()
-    gpu_info: list[dict[str, Any]] = []
-    os_info: dict[str, Any] = {}
-    if isinstance(system_info, dict):
-        raw_gpu = system_info.get("gpu") or []
-        if isinstance(raw_gpu, dict):
-            gpu_info = [raw_gpu]
-        elif isinstance(raw_gpu, list):
-            gpu_info = raw_gpu
-        else:
-            gpu_info = []
-        raw_os = system_info.get("os") or {}
-        os_info = raw_os if isinstance(raw_os, dict) else {}
-
-    summary = {
+    head = {
         "generated_at": timestamp_now(),
         "bundle_dir": str(bundle_dir),
-        "artifact_stats": _collect_artifact_stats(bundle_dir),
-        "report_count": len(reports),
-        "signature_counts": signature_list,
-        "reports": reports,
-        "system_info": system_info,
-        "gpu": gpu_info,
-        "os": os_info,
-        "sysinfo": _load_sysinfo(bundle_dir),
-        "memory_csv": _load_memory_csv(bundle_dir),
-        "manifest": manifest,
+        "artifact_stats": _collect_artifact_stats(scan),
     }
 
+    signature_counts: Counter[str] = Counter()
+
+    def _reports() -> Iterator[dict[str, Any]]:
+        # Signatures are tallied as reports stream out, so no report is kept.
+        # Reports are read and parsed on a pool in bounded, ordered batches.
+        paths = scan["wer_reports"]
+        with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as ex:
+            for start in range(0, len(paths), PARSE_BATCH):
+                for report in ex.map(parse_wer_report, paths[start : start + PARSE_BATCH]):
+                    signature_counts[_signature_key(report)] += 1
+                    yield report
+
+    def _tail() -> dict[str, Any]:
+        signature_list = [
+            {"signature": k, "count": v} for k, v in signature_counts.most_common()
+        ]
+        system_info = system_info_future.result()
+        gpu_info: list[dict[str, Any]] = []
+        os_info: dict[str, Any] = {}
+        if isinstance(system_info, dict):
+            raw_gpu = system_info.get("gpu") or []
+            if isinstance(raw_gpu, dict):
+                gpu_info = [raw_gpu]
+            elif isinstance(raw_gpu, list):
+                gpu_info = raw_gpu
+            else:
+                gpu_info = []
+            raw_os = system_info.get("os") or {}
+            os_info = raw_os if isinstance(raw_os, dict) else {}
+        return {
+            "report_count": sum(signature_counts.values()),
+            "signature_counts": signature_list,
+            "system_info": system_info,
+            "gpu": gpu_info,
+            "os": os_info,
+            "sysinfo": _load_sysinfo(scan["sysinfo"]),
+            "memory_csv": _load_memory_csv(scan["memory_csv"]),
+            "manifest": manifest,
+        }
+
     summary_json_path = output_dir / "summary.json"
     summary_txt_path = output_dir / "summary.txt"
 
-    summary_json_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    summary = head | _write_summary_json(summary_json_path, head, _reports(), _tail)
+    signature_list = summary["signature_counts"]
 
     lines = []
     lines.append("pc-crash-kit summary")
@@ -7,19 +7,27 @@ import os
 import platform
 import shutil
 import subprocess
+import time
 import tomllib
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterator, Sequence
+
+try:
+    import orjson  # optional: C-backed encoding for large summaries
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def is_windows() -> bool:
     return platform.system().lower() == "windows"
 
 
+@lru_cache(maxsize=1)
 def is_wsl() -> bool:
     if is_windows():
         return False
@@ -34,6 +42,7 @@ def is_wsl() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def is_admin() -> bool:
     if not is_windows():
         return False
@@ -44,7 +53,7 @@ def is_admin() -> bool:
 
 
 def timestamp_now() -> str:
-    return datetime.now().strftime("%Y%m%d-%H%M%S")
+    return time.strftime("%Y%m%d-%H%M%S")
 
 
 def ensure_dir(path: Path) -> Path:
@@ -62,6 +71,18 @@ def format_bytes(n: int) -> str:
     return f"{size:.1f}PB"
 
 
+def json_bytes(value: object) -> bytes:
+    # indent=2 JSON as UTF-8 bytes, encoded by orjson when it is installed
+    # (the "fast" extra). The fallback writes non-ASCII text raw, as orjson
+    # does; only float spellings such as 1e-07 vs 1e-7 still differ.
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str)
+        except TypeError:
+            pass  # e.g. non-str keys or out-of-range ints; stdlib handles those
+    return json.dumps(value, indent=2, default=str, ensure_ascii=False).encode("utf-8")
+
+
 def run_cmd(cmd: Sequence[str], capture: bool = True, check: bool = False) -> subprocess.CompletedProcess:
     logger.debug("Running command: %s", " ".join(cmd))
     return subprocess.run(cmd, capture_output=capture, text=True, check=check)
@@ -73,53 +94,68 @@ class CopyReport:
     skipped_large: list[dict]
     missing: list[str]
 
+    def extend(self, other: CopyReport) -> None:
+        self.copied.extend(other.copied)
+        self.skipped_large.extend(other.skipped_large)
+        self.missing.extend(other.missing)
+
+    def to_dict(self) -> dict:
+        return {
+            "copied": self.copied,
+            "skipped_large": self.skipped_large,
+            "missing": self.missing,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "copied": self.copied,
-                "skipped_large": self.skipped_large,
-                "missing": self.missing,
-            },
-            indent=2,
-        )
+        return json_bytes(self.to_dict()).decode("utf-8")
 
 
-def _should_skip(path: Path, max_bytes: int, include_large_dumps: bool) -> bool:
-    if include_large_dumps:
-        return False
+def _copy_file(
+    src: Path | str,
+    dest: Path | str,
+    preserve_metadata: bool,
+    st: os.stat_result | None = None,
+) -> None:
+    if preserve_metadata:
+        shutil.copy2(src, dest)
+        return
+    # copyfile skips copystat's mode/xattr work. Timestamps are still carried
+    # over because bundles are later searched by mtime (newest sysinfo.txt).
+    shutil.copyfile(src, dest)
     try:
-        return path.stat().st_size > max_bytes
-    except OSError:
-        return False
+        if st is None:
+            st = os.stat(src)
+        os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError as exc:
+        logger.debug("Unable to carry timestamps to %s: %s", dest, exc)
 
 
 def copy_file_with_limit(
     src: Path,
-    dest: Path,
+    dest: Path | str,
     report: CopyReport,
     max_bytes: int,
     include_large_dumps: bool,
+    preserve_metadata: bool = False,
 ) -> None:
+    # One stat answers "does it exist", "is it too large" and feeds the
+    # timestamp copy.
     try:
-        if not src.exists():
-            report.missing.append(str(src))
-            return
+        st = os.stat(src)
     except OSError:
         report.missing.append(str(src))
         return
 
-    if _should_skip(src, max_bytes, include_large_dumps):
-        size_bytes = None
-        try:
-            size_bytes = src.stat().st_size
-        except OSError:
-            size_bytes = None
-        report.skipped_large.append({"path": str(src), "size_bytes": size_bytes})
+    if not include_large_dumps and st.st_size > max_bytes:
+        report.skipped_large.append({"path": str(src), "size_bytes": st.st_size})
         return
 
     try:
-        ensure_dir(dest.parent)
-        shutil.copy2(src, dest)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        # copyfile/copy2 take the platform fast path (sendfile/fcopyfile, or
+        # 1 MiB readinto chunks on Windows), so dumps never go through a small
+        # Python-level buffer.
+        _copy_file(src, dest, preserve_metadata, st)
         report.copied.append(str(dest))
     except OSError as exc:
         logger.warning("Failed to copy %s: %s", src, exc)
@@ -132,6 +168,7 @@ def copy_dir_with_limit(
     report: CopyReport,
     max_bytes: int,
     include_large_dumps: bool,
+    preserve_metadata: bool = False,
 ) -> None:
     try:
         if not src_dir.exists():
@@ -141,31 +178,115 @@ def copy_dir_with_limit(
         report.missing.append(str(src_dir))
         return
 
-    for root, dirs, files in os_walk(src_dir):
-        rel = Path(root).relative_to(src_dir)
-        target_root = dest_dir / rel
-        ensure_dir(target_root)
-        for name in files:
-            src_file = Path(root) / name
-            dest_file = target_root / name
-            if _should_skip(src_file, max_bytes, include_large_dumps):
-                size_bytes = None
-                try:
-                    size_bytes = src_file.stat().st_size
-                except OSError:
-                    size_bytes = None
-                report.skipped_large.append({"path": str(src_file), "size_bytes": size_bytes})
+    if include_large_dumps:
+        _copy_tree(src_dir, dest_dir, report, preserve_metadata)
+        return
+
+    src_root = str(src_dir)
+    dest_root = str(dest_dir)
+    for rel, entries in scandir_walk(src_root):
+        target_root = os.path.join(dest_root, rel) if rel else dest_root
+        os.makedirs(target_root, exist_ok=True)
+        for entry in entries:
+            if entry_is_dir(entry):
                 continue
+            dest_file = os.path.join(target_root, entry.name)
             try:
-                shutil.copy2(src_file, dest_file)
-                report.copied.append(str(dest_file))
+                st = entry.stat()
             except OSError as exc:
-                logger.warning("Failed to copy %s: %s", src_file, exc)
-                report.missing.append(str(src_file))
+                logger.warning("Failed to copy %s: %s", entry.path, exc)
+                report.missing.append(entry.path)
+                continue
+            if st.st_size > max_bytes:
+                report.skipped_large.append({"path": entry.path, "size_bytes": st.st_size})
+                continue
+            try:
+                _copy_file(entry.path, dest_file, preserve_metadata, st)
+                report.copied.append(dest_file)
+            except OSError as exc:
+                logger.warning("Failed to copy %s: %s", entry.path, exc)
+                report.missing.append(entry.path)
+
+
+def _copy_tree(
+    src_dir: Path, dest_dir: Path, report: CopyReport, preserve_metadata: bool
+) -> None:
+    # No size cap applies, so let copytree drive the walk and the copies.
+    # Symlinked directories are skipped to match scandir_walk. copytree
+    # always copystat()s the directories it creates, so directory mode and
+    # times are carried over even without preserve_metadata.
+    def _copy(src: str, dst: str) -> str:
+        _copy_file(src, dst, preserve_metadata)
+        report.copied.append(dst)
+        return dst
+
+    def _skip_dir_links(parent: str, names: list[str]) -> set[str]:
+        skipped = set()
+        for name in names:
+            path = os.path.join(parent, name)
+            if os.path.islink(path) and os.path.isdir(path):
+                skipped.add(name)
+        return skipped
+
+    try:
+        shutil.copytree(
+            src_dir,
+            dest_dir,
+            ignore=_skip_dir_links,
+            copy_function=_copy,
+            dirs_exist_ok=True,
+        )
+    except shutil.Error as exc:
+        for src, _, why in exc.args[0]:
+            logger.warning("Failed to copy %s: %s", src, why)
+            report.missing.append(src)
+    except OSError as exc:
+        logger.warning("Failed to copy %s: %s", src_dir, exc)
+        report.missing.append(str(src_dir))
+
+
+def scandir_walk(top: str, rel: str = "") -> Iterator[tuple[str, list[os.DirEntry]]]:
+    # Top-down like os.walk: yields (relative dir, entries) for a directory
+    # before its subdirectories. Symlinked directories are listed but not
+    # followed. The DirEntry objects carry the stat cache from the listing.
+    try:
+        with os.scandir(os.path.join(top, rel) if rel else top) as it:
+            entries = list(it)
+    except OSError as err:
+        logger.warning("walk error: %s", err)
+        return
+    yield rel, entries
+    for entry in entries:
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+        except OSError:
+            continue
+        yield from scandir_walk(top, os.path.join(rel, entry.name) if rel else entry.name)
+
 
+def entry_stat(entry: os.DirEntry) -> os.stat_result | None:
+    # DirEntry caches stat data from the directory listing on Windows.
+    try:
+        return entry.stat()
+    except OSError:
+        return None
 
-def os_walk(path: Path) -> Iterable[tuple[str, list[str], list[str]]]:
-    return os.walk(path, onerror=lambda err: logger.warning("walk error: %s", err))
+
+def entry_is_dir(entry: os.DirEntry) -> bool:
+    # An entry can vanish or deny access between listing and check; treat
+    # that as "not a directory".
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def entry_is_file(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
 
 
 def wsl_to_windows_path(path: Path) -> str:
@@ -191,35 +312,53 @@ def wsl_to_windows_path(path: Path) -> str:
     return raw.replace("/", "\\")
 
 
-def load_config(config_path: Path | None = None) -> tuple[dict, Path | None]:
-    env_path = os.environ.get("PC_CRASH_KIT_CONFIG")
-    if config_path is None and env_path:
-        config_path = Path(env_path)
-
-    if config_path is None:
-        candidates: list[Path] = [Path.cwd() / "pc-crash-kit.toml"]
-        if is_windows():
-            appdata = os.environ.get("APPDATA")
-            local = os.environ.get("LOCALAPPDATA")
-            if appdata:
-                candidates.append(Path(appdata) / "pc-crash-kit" / "config.toml")
-            if local:
-                candidates.append(Path(local) / "pc-crash-kit" / "config.toml")
-        else:
-            candidates.append(Path.home() / ".config" / "pc-crash-kit" / "config.toml")
-
-        for path in candidates:
-            if path.exists():
-                config_path = path
-                break
-
-    if config_path is None or not config_path.exists():
-        return {}, None
-
+def _read_config(config_path: Path) -> tuple[dict, Path | None]:
     try:
         raw = config_path.read_bytes()
         data = tomllib.loads(raw.decode("utf-8"))
         return data, config_path
+    except FileNotFoundError:
+        return {}, None
     except Exception as exc:
         logger.warning("Failed to load config %s: %s", config_path, exc)
         return {}, None
+
+
+# Keyed on everything discovery depends on, so a changed cwd or environment
+# still finds the right file. Callers treat the returned table as read-only.
+@lru_cache(maxsize=8)
+def _load_discovered_config(
+    cwd: str, appdata: str | None, local: str | None, home: str
+) -> tuple[dict, Path | None]:
+    candidates: list[Path] = [Path(cwd) / "pc-crash-kit.toml"]
+    if is_windows():
+        if appdata:
+            candidates.append(Path(appdata) / "pc-crash-kit" / "config.toml")
+        if local:
+            candidates.append(Path(local) / "pc-crash-kit" / "config.toml")
+    else:
+        candidates.append(Path(home) / ".config" / "pc-crash-kit" / "config.toml")
+
+    for path in candidates:
+        try:
+            path.stat()
+        except OSError:
+            continue
+        return _read_config(path)
+    return {}, None
+
+
+def load_config(config_path: Path | None = None) -> tuple[dict, Path | None]:
+    env_path = os.environ.get("PC_CRASH_KIT_CONFIG")
+    if config_path is None and env_path:
+        config_path = Path(env_path)
+
+    if config_path is not None:
+        return _read_config(config_path)
+
+    return _load_discovered_config(
+        str(Path.cwd()),
+        os.environ.get("APPDATA"),
+        os.environ.get("LOCALAPPDATA"),
+        str(Path.home()),
+    )
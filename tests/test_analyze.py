@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from crashkit.analyze import Event, _parse_dt, load_events, score_suspects
+
+
+def test_parse_dt_windows_export_shapes() -> None:
+    assert _parse_dt("2024-01-02T03:04:05.1234567Z") == datetime(2024, 1, 2, 3, 4, 5, 123456)
+    assert _parse_dt("2024-01-02T03:04:05.123+02:00") == datetime(2024, 1, 2, 3, 4, 5, 123000)
+    assert _parse_dt("2024-01-02 03:04:05") == datetime(2024, 1, 2, 3, 4, 5)
+    assert _parse_dt("1/2/2024 3:04:05 PM") == datetime(2024, 1, 2, 15, 4, 5)
+    assert _parse_dt("12/31/2024 12:00:00 AM") == datetime(2024, 12, 31, 0, 0, 0)
+    assert _parse_dt("2024-01-02") == datetime(2024, 1, 2)
+
+
+def test_parse_dt_drops_short_and_long_offsets() -> None:
+    assert _parse_dt("2024-01-02T03:04:05+02") == datetime(2024, 1, 2, 3, 4, 5)
+    assert _parse_dt("2024-01-02T03:04:05-08") == datetime(2024, 1, 2, 3, 4, 5)
+    assert _parse_dt("2024-01-02T03:04:05+02:00:00") == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_load_events_mixes_offset_and_naive_times(tmp_path: Path) -> None:
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    events = [
+        {"TimeCreated": "2024-01-02T03:04:05+02", "Id": 41, "ProviderName": "Kernel-Power"},
+        {"TimeCreated": "2024-01-02 01:00:00", "Id": 6008, "ProviderName": "EventLog"},
+    ]
+    (logs / "system_events.json").write_text(json.dumps(events), encoding="utf-8")
+
+    loaded = load_events(tmp_path)
+
+    assert [e.event_id for e in loaded] == [6008, 41]
+    assert all(e.time is not None and e.time.tzinfo is None for e in loaded)
+
+
+def test_parse_dt_rejects_garbage() -> None:
+    assert _parse_dt("") is None
+    assert _parse_dt(None) is None
+    assert _parse_dt("not a date") is None
+    assert _parse_dt("2024-13-45 03:04:05") is None
+
+
+def _event(provider: str, message: str) -> Event:
+    return Event(time=None, log="System", event_id=None, level="Error", provider=provider, message=message)
+
+
+def test_score_suspects_literal_and_hex_buckets() -> None:
+    events = [
+        _event("BugCheck", "The computer has rebooted from a bugcheck: 0x00000116"),
+        _event("Service Control Manager", "Stop code 0X9F was reported"),
+        _event("nvlddmkm", "Display driver stopped responding"),
+    ]
+    counts = dict(score_suspects(events))
+    assert counts["Bugcheck / BSOD style crash"] == 2
+    assert counts["GPU driver reset (TDR) or display stack"] == 1
+    assert counts["Driver/service instability"] == 1
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import fnmatch
+
+import pytest
+
+from pc_crash_kit import collect
+
+NAMES = [
+    "Kernel_193_abc",
+    "kernel_193_abc",
+    "KERNEL_15E_1",
+    "Kernel_1a8_",
+    "Kernel_19",
+    "AppCrash_game.exe_1",
+    "AppHang_game.exe_2",
+    "Critical_x",
+    "x_Kernel_193_abc",
+    "",
+]
+
+PATTERN_SETS = [
+    ("Kernel_193_*", "Kernel_15e_*", "Kernel_1a8_*"),
+    ("Kernel_*", "Kernel_193_*"),
+    ("Kernel_193_*", "AppCrash_*.exe_?"),
+    ("App*_game.exe_*", "Critical_[xy]"),
+    ("Kernel_19",),
+    ("*",),
+]
+
+
+@pytest.mark.parametrize("os_name", ["posix", "nt"])
+@pytest.mark.parametrize("patterns", PATTERN_SETS)
+def test_name_matcher_agrees_with_fnmatch(monkeypatch, os_name: str, patterns: tuple[str, ...]) -> None:
+    monkeypatch.setattr(collect.os, "name", os_name)
+    collect._name_matcher.cache_clear()
+    try:
+        match = collect._name_matcher(patterns)
+        for name in NAMES:
+            if os_name == "nt":
+                expected = any(fnmatch.fnmatchcase(name.lower(), p.lower()) for p in patterns)
+            else:
+                expected = any(fnmatch.fnmatchcase(name, p) for p in patterns)
+            assert bool(match(name)) == expected, (name, patterns)
+    finally:
+        collect._name_matcher.cache_clear()
+
+
+class _FlakyEntry:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.path = f"/base/{name}"
+
+    def is_dir(self) -> bool:
+        raise PermissionError(self.path)
+
+    def is_file(self) -> bool:
+        raise PermissionError(self.path)
+
+
+def test_find_latest_skips_entries_that_fail_type_checks(tmp_path, monkeypatch) -> None:
+    (tmp_path / "Kernel_193_ok").mkdir()
+    (tmp_path / "dump.dmp").write_bytes(b"x")
+    real_scandir = collect._try_scandir
+
+    def scandir_with_flaky(base, strict_access):
+        return [*real_scandir(base, strict_access), _FlakyEntry("Kernel_193_gone")]
+
+    monkeypatch.setattr(collect, "_try_scandir", scandir_with_flaky)
+
+    dirs = collect.find_latest_dirs(tmp_path, ["Kernel_193_*"], latest_n=5)
+    files = collect.find_latest_files(tmp_path, latest_n=5)
+
+    assert [p.name for p in dirs] == ["Kernel_193_ok"]
+    assert [p.name for p in files] == ["dump.dmp"]
+
+
+def test_find_latest_orders_small_selections_by_name(tmp_path, monkeypatch) -> None:
+    for name in ("c.dmp", "a.dmp", "b.dmp"):
+        (tmp_path / name).write_bytes(b"x")
+    real_scandir = collect._try_scandir
+    monkeypatch.setattr(
+        collect,
+        "_try_scandir",
+        lambda base, strict: sorted(real_scandir(base, strict), key=lambda e: e.name, reverse=True),
+    )
+
+    files = collect.find_latest_files(tmp_path, latest_n=3)
+
+    assert [p.name for p in files] == ["a.dmp", "b.dmp", "c.dmp"]
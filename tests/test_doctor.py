@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pc_crash_kit import doctor as doctor_mod
+
+
+def test_doctor_checks_merge_in_report_order(tmp_path: Path, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(output_dir: Path, flags: list[str]) -> dict:
+        calls.append(flags)
+        payload = {
+            "output_dir": str(output_dir),
+            "is_admin": False,
+            "commands": [{"flags": flags}],
+            "skipped": [],
+            "errors": [],
+        }
+        if flags == ["-DxDiag"]:
+            payload["errors"] = ["dxdiag failed"]
+            payload["stderr"] = "dxdiag stderr"
+        if flags == ["-MsInfo"]:
+            payload["errors"] = "msinfo failed"
+            payload["stderr"] = "msinfo stderr"
+            payload["raw"] = "not json"
+        return payload
+
+    monkeypatch.setattr(doctor_mod, "_run_doctor_script", fake_run)
+    checks = {"sfc": True, "msinfo": True, "dism_scan": True, "dxdiag": True, "drivers": False}
+    result = doctor_mod._run_doctor_checks(tmp_path, checks)
+
+    # Independent checks run one per script call; CBS checks share the last call.
+    assert sorted(calls[:2]) == [["-DxDiag"], ["-MsInfo"]]
+    assert calls[2] == ["-RunSfc", "-DismScan"]
+    assert [c["flags"] for c in result["commands"]] == [
+        ["-DxDiag"],
+        ["-MsInfo"],
+        ["-RunSfc", "-DismScan"],
+    ]
+    assert result["errors"] == ["dxdiag failed", "msinfo failed"]
+    assert result["stderr"] == ["dxdiag stderr", "msinfo stderr"]
+    # Only one run produced raw output, so it keeps the one-run string shape.
+    assert result["raw"] == "not json"
+    assert result["output_dir"] == str(tmp_path)
+
+
+def test_doctor_checks_without_flags_runs_script_once(tmp_path: Path, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(output_dir: Path, flags: list[str]) -> dict:
+        calls.append(flags)
+        return {"output_dir": str(output_dir)}
+
+    monkeypatch.setattr(doctor_mod, "_run_doctor_script", fake_run)
+    result = doctor_mod._run_doctor_checks(tmp_path, {})
+
+    assert calls == [[]]
+    assert result["commands"] == [] and result["skipped"] == [] and result["errors"] == []
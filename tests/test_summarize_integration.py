@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
+from pc_crash_kit import summarize as summarize_mod
 from pc_crash_kit.summarize import summarize
 
 
@@ -57,3 +60,70 @@ def test_summarize_parses_wer_and_sysinfo(tmp_path: Path) -> None:
     mem = summary.get("memory_csv")
     assert mem is not None
     assert mem["rows"][0]["Location"] == "Physical"
+
+
+def _write_minimal_reports(bundle_dir: Path, count: int) -> None:
+    for i in range(count):
+        report_dir = bundle_dir / "wer" / f"Kernel_193_{i:03d}"
+        report_dir.mkdir(parents=True, exist_ok=True)
+        lines = ["EventType=LiveKernelEvent", "Sig[0].Name=Code", "Sig[0].Value=193"]
+        if i % 3 == 0:
+            lines += ["Sig[1].Name=Parameter 1", "Sig[1].Value=80e"]
+        (report_dir / "Report.wer").write_text("\n".join(lines), encoding="utf-8")
+
+
+def _fake_system_info() -> dict:
+    return {"os": {"caption": "Windows 11"}, "gpu": [{"name": "ExampleGPU"}]}
+
+
+@pytest.mark.parametrize("count", [0, 2 * summarize_mod.PARSE_BATCH + 3])
+def test_summary_json_layout(tmp_path: Path, monkeypatch, count: int) -> None:
+    monkeypatch.setattr(summarize_mod, "_load_system_info", _fake_system_info)
+    bundle = tmp_path / "bundle"
+    bundle.mkdir()
+    _write_minimal_reports(bundle, count)
+    out_dir = tmp_path / "out"
+
+    result = summarize(bundle, output_dir=out_dir)
+
+    text = Path(result["summary_json"]).read_text(encoding="utf-8")
+    summary = json.loads(text)
+    assert text == json.dumps(summary, indent=2, ensure_ascii=False)
+    assert list(summary)[:4] == ["generated_at", "bundle_dir", "artifact_stats", "reports"]
+    assert summary["report_count"] == count
+    assert len(summary["reports"]) == count
+    assert len({r["path"] for r in summary["reports"]}) == count
+    with_sig1 = len(range(0, count, 3))
+    expected = [
+        {"signature": "Sig0=193 Sig1=NA", "count": count - with_sig1},
+        {"signature": "Sig0=193 Sig1=80e", "count": with_sig1},
+    ]
+    assert summary["signature_counts"] == [e for e in expected if e["count"]]
+    assert summary["gpu"] == [{"name": "ExampleGPU"}]
+    assert list(out_dir.glob("*.tmp")) == []
+
+
+def test_summary_json_not_replaced_when_tail_fails(tmp_path: Path, monkeypatch) -> None:
+    def _broken_system_info() -> dict:
+        raise FileNotFoundError("powershell.exe")
+
+    monkeypatch.setattr(summarize_mod, "_load_system_info", _broken_system_info)
+    _write_minimal_reports(tmp_path, 3)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    previous = out_dir / "summary.json"
+    previous.write_text('{"old": true}', encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        summarize(tmp_path, output_dir=out_dir)
+
+    assert json.loads(previous.read_text(encoding="utf-8")) == {"old": True}
+    assert list(out_dir.glob("*.tmp")) == []
+
+
+def test_read_text_guess_handles_bomless_utf16(tmp_path: Path) -> None:
+    text = "OS Name: Microsoft Windows 11 Pro\r\nSystem Model: ExampleModel\r\n"
+    path = tmp_path / "sysinfo.txt"
+    path.write_bytes(text.encode("utf-16-le"))
+
+    assert summarize_mod._read_text_guess(path) == text
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pc_crash_kit import utils
+from pc_crash_kit.utils import CopyReport, copy_dir_with_limit
+
+
+@pytest.mark.parametrize("include_large_dumps", [False, True])
+def test_copy_dir_skips_symlinked_directories(tmp_path: Path, include_large_dumps: bool) -> None:
+    src = tmp_path / "src"
+    (src / "loop" / "d").mkdir(parents=True)
+    (src / "loop" / "d" / "file.txt").write_text("data", encoding="utf-8")
+    try:
+        os.symlink("..", src / "loop" / "d" / "up", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+
+    dest = tmp_path / "dest"
+    report = CopyReport(copied=[], skipped_large=[], missing=[])
+    copy_dir_with_limit(src, dest, report, max_bytes=1024, include_large_dumps=include_large_dumps)
+
+    assert report.copied == [str(dest / "loop" / "d" / "file.txt")]
+    assert report.missing == []
+    assert (dest / "loop" / "d" / "file.txt").read_text(encoding="utf-8") == "data"
+    assert not (dest / "loop" / "d" / "up").exists()
+
+
+def test_json_bytes_stdlib_fallback_writes_utf8(monkeypatch) -> None:
+    monkeypatch.setattr(utils, "orjson", None)
+    assert utils.json_bytes({"name": "café"}) == '{\n  "name": "café"\n}'.encode("utf-8")
+
+
+def test_scandir_walk_lists_but_does_not_follow_dir_symlinks(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "f.txt").write_text("x", encoding="utf-8")
+    try:
+        os.symlink("..", tmp_path / "a" / "b" / "up", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+
+    walked = {rel: sorted(e.name for e in entries) for rel, entries in utils.scandir_walk(str(tmp_path))}
+
+    b = os.path.join("a", "b")
+    assert walked == {"": ["a"], "a": ["b"], b: ["f.txt", "up"]}